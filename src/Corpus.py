@@ -0,0 +1,211 @@
+# Created 2026/10/19
+# Author: Caleb Bryant
+# Title: Corpus.py
+# Description: This file defines a content-addressed node table used to lint a corpus of parser configs at once. Identical filter, conditional and loop blocks are hash-consed so their context-free rule results are computed once per corpus instead of once per file.
+# References: https://en.wikipedia.org/wiki/Hash_consing
+
+import hashlib, json, os, time
+import Plugins
+from Parser import Parser
+
+# options each filter plugin accepts, keyed by plugin name
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "chronicle", "logstash_functions_schema.json")
+with open(SCHEMA_FILE) as schema_file:
+    SCHEMA = json.load(schema_file)
+
+# Context-free rules, each rule takes a node and returns a result that only depends on the node's own contents.
+# Rules that depend on the surrounding parser state (AST.State) must not be added here, they are recomputed per file.
+# only plugins whose schema lists on_error can be missing one, drop and statedump do not take it
+def missing_on_error_rule(node) -> bool:
+    if isinstance(node, Plugins.Filter) and "on_error" in SCHEMA.get(node.name, {}):
+        return node.missing_on_error
+    return False
+
+# returns the sorted names of options the plugin's schema does not list, plugins missing from the schema are not checked
+def unsupported_options_rule(node) -> tuple:
+    if isinstance(node, Plugins.Filter) and node.name in SCHEMA:
+        return tuple(sorted(option for option in node.config_options if option not in SCHEMA[node.name]))
+    return ()
+
+RULES = {
+    "missing_on_error": missing_on_error_rule,
+    "unsupported_options": unsupported_options_rule,
+}
+
+class Node:
+    """
+    An entry in the NodeTable, one per distinct normalized block.
+
+    Attributes:
+        digest (str): The content address of the block.
+        value: The first parsed object seen with this content, used as the canonical node.
+        children (list): The digests of the node's nested blocks.
+        count (int): The number of times the block was seen across the corpus.
+        results (dict): Memoized rule results, keyed by rule name. Results are immutable since they are shared across files.
+        cost (float): Seconds spent computing the memoized rule results.
+    """
+    def __init__(self, digest: str, value, children: list) -> None:
+        self.digest = digest
+        self.value = value
+        self.children = children
+        self.count = 0
+        self.results = None
+        self.cost = 0.0
+
+class NodeTable:
+    """
+    The NodeTable hash-conses parsed Plugins objects by their normalized contents and memoizes rule results per distinct node.
+
+    Attributes:
+        nodes (dict): Maps a node digest to its Node entry.
+        rules (dict): Maps a rule name to the function used to compute it.
+        seen (int): The number of blocks added to the table, including duplicates.
+        files (int): The number of parsed configs added to the table.
+        time_parsing (float): Seconds spent parsing configs, paid for every file whether or not its blocks are shared.
+        time_skipped (float): Seconds of rule computation skipped by reusing memoized results.
+        time_interning (float): Seconds spent normalizing and hashing blocks, the overhead paid for the skipped computation.
+
+    Methods:
+        parse_file: Parses a config file with a new Parser and returns its tokens.
+        add_tree: Interns every block of a parsed config and returns the digests of its top level blocks.
+        intern: Interns a single parsed block and its nested blocks, returning its digest.
+        analyze: Returns the rule results for a node digest, computing them only the first time.
+        dedup_ratio: Returns the number of blocks seen divided by the number of distinct blocks.
+        net_time_saved: Returns the skipped rule computation time minus the time spent interning.
+        report: Returns a summary string of the table's dedup ratio and time saved.
+    """
+    def __init__(self, rules: dict = None) -> None:
+        """
+        Initializes an instance of the NodeTable class.
+        """
+        self.nodes = {}
+        self.rules = rules if rules is not None else RULES
+        self.seen = 0
+        self.files = 0
+        self.time_parsing = 0.0
+        self.time_skipped = 0.0
+        self.time_interning = 0.0
+
+    def parse_file(self, file_name: str) -> list:
+        """
+        Parses a config file with a new Parser, since each Parser collects its file's values in its own AST.
+
+        Args:
+            file_name (str): The name of the file to parse.
+
+        Returns:
+            list: The parsed tokens.
+        """
+        start = time.perf_counter()
+        try:
+            return Parser().parse_file(file_name)
+        finally:
+            self.time_parsing += time.perf_counter() - start
+
+    def add_tree(self, tokens: list) -> list:
+        """
+        Interns every block of a parsed config.
+
+        Args:
+            tokens (list): The parsed tokens returned by Parser.parse_string or Parser.parse_file.
+
+        Returns:
+            list: The digests of the config's top level blocks.
+        """
+        self.files += 1
+        start = time.perf_counter()
+        digests = [self.intern(token) for token in tokens]
+        self.time_interning += time.perf_counter() - start
+        return digests
+
+    def intern(self, value) -> str:
+        """
+        Interns a single parsed block and its nested blocks.
+
+        Args:
+            value: A Plugins.Filter, Plugins.Conditional or Plugins.Loop object.
+
+        Returns:
+            str: The content address of the block.
+        """
+        children = [self.intern(child) for child in self.get_children(value)]
+        key = (self.normalize(value), tuple(children))
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        if digest not in self.nodes:
+            self.nodes[digest] = Node(digest, value, children)
+        self.nodes[digest].count += 1
+        self.seen += 1
+        return digest
+
+    def analyze(self, digest: str) -> dict:
+        """
+        Returns the rule results for a node, computing them only the first time the node is analyzed.
+
+        Args:
+            digest (str): The content address of the node.
+
+        Returns:
+            dict: A copy of the rule results keyed by rule name.
+        """
+        node = self.nodes[digest]
+        if node.results is not None:
+            self.time_skipped += node.cost
+            return dict(node.results)
+        start = time.perf_counter()
+        node.results = {name: rule(node.value) for name, rule in self.rules.items()}
+        node.cost = time.perf_counter() - start
+        return dict(node.results)
+
+    def dedup_ratio(self) -> float:
+        """
+        Returns the number of blocks seen divided by the number of distinct blocks.
+
+        Returns:
+            float: The dedup ratio, 1.0 means no block was shared.
+        """
+        return self.seen / len(self.nodes) if self.nodes else 1.0
+
+    def net_time_saved(self) -> float:
+        """
+        Returns the skipped rule computation time minus the time spent interning.
+
+        Returns:
+            float: Seconds saved compared to running every rule on every block, negative when interning cost more than it saved.
+        """
+        return self.time_skipped - self.time_interning
+
+    def report(self) -> str:
+        """
+        Returns a summary of the table.
+
+        Returns:
+            str: The number of configs and blocks, the dedup ratio, the parse time and the net time saved.
+        """
+        return (
+            f"{self.files} configs, {self.seen} blocks, {len(self.nodes)} distinct, "
+            f"dedup ratio {self.dedup_ratio():.2f}, spent {self.time_parsing * 1000:.3f}ms parsing, skipped {self.time_skipped * 1000:.3f}ms of analysis, "
+            f"spent {self.time_interning * 1000:.3f}ms interning, net saved {self.net_time_saved() * 1000:.3f}ms"
+        )
+
+    # returns the nested blocks of a conditional or loop, filters have none
+    def get_children(self, value) -> list:
+        if isinstance(value, (Plugins.Conditional, Plugins.Loop)):
+            return value.contents or []
+        return []
+
+    # returns a hashable representation of a block's own contents, nested blocks are addressed by digest in intern
+    def normalize(self, value):
+        if isinstance(value, Plugins.Filter):
+            options = tuple(sorted((key, self.normalize(option)) for key, option in value.config_options.items()))
+            return (type(value).__name__, value.name, options)
+        elif isinstance(value, Plugins.FunctionOption):
+            return (type(value).__name__, value.name, self.normalize(getattr(value, "value", None)))
+        elif isinstance(value, (Plugins.Conditional, Plugins.Loop)):
+            # only strip the whitespace SkipTo leaves around the statement, whitespace inside it can be part of a string literal
+            statement = value.statement.strip() if isinstance(value.statement, str) else value.statement
+            return (type(value).__name__, value.name, statement)
+        elif isinstance(value, dict):
+            return ("dict", tuple(sorted((key, self.normalize(item)) for key, item in value.items())))
+        elif isinstance(value, list):
+            return ("list", tuple(self.normalize(item) for item in value))
+        return value
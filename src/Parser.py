@@ -258,9 +258,9 @@ class Parser:
             Plugins.Conditional: The converted Conditional object.
         """
         if tokens[0] == "else":
-            cond = Plugins.Conditional(tokens[0], contents=tokens[1])
+            cond = Plugins.Conditional(tokens[0], contents=list(tokens[1:]))
         else:
-            cond = Plugins.Conditional(tokens[0], statement=tokens[1], contents=tokens[2])
+            cond = Plugins.Conditional(tokens[0], statement=tokens[1], contents=list(tokens[2:]))
         self.ast.add_conditional(cond)
         return cond
     
@@ -274,7 +274,7 @@ class Parser:
         Returns:
             Plugins.Loop: The converted Loop object.
         """
-        loop = Plugins.Loop(tokens[1], tokens[2])
+        loop = Plugins.Loop(tokens[1], list(tokens[2:]))
         self.ast.add_loop(loop)
         return loop
 
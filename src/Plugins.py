@@ -11,7 +11,11 @@ class Filter:
     def __init__(self, name: str, config_options: dict) -> None:
         self.name = name
         self.config_options = config_options
-        self.missing_on_error = not self.has_on_error() # boolean value denoting if this function needs an on_error statement
+
+    # boolean value denoting if this function needs an on_error statement, derived on access so parsing doesn't pay for it
+    @property
+    def missing_on_error(self) -> bool:
+        return not self.has_on_error()
 
     # returns true if the function has an on_error statement, false if not
     def has_on_error(self) -> bool:
@@ -28,7 +32,10 @@ class Filter:
 class Mutate(Filter):
     def __init__(self, name: str, config_options: dict) -> None:
         super().__init__(name, config_options)
-        self.missing_on_error = self.needs_on_error() and not self.has_on_error()
+
+    @property
+    def missing_on_error(self) -> bool:
+        return self.needs_on_error() and not self.has_on_error()
 
     def needs_on_error(self) -> bool:
         needs_on_error = False
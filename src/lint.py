@@ -1,9 +1,10 @@
 # author: caleb.bryant@cyderes.com
 # created: 2023/04/02
 
-import argparse
+import argparse, glob, os
 from pyparsing import exceptions
 from Parser import Parser
+from Corpus import NodeTable
 
 def lint_cbn():
     parser = argparse.ArgumentParser(
@@ -11,7 +12,9 @@ def lint_cbn():
         description='Chronicle CBN Linting Tool'
     )
 
-    parser.add_argument('-f', '--config_file', help="Path to the config file to lint", required=True)
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument('-f', '--config_file', help="Path to the config file to lint")
+    input_group.add_argument('-c', '--corpus', help="Path to a directory of config files to lint together, identical blocks are analyzed once")
     parser.add_argument('-e', '--errors', action='store_true', help="Print the parser's errors to terminal")
     parser.add_argument('-w', '--warnings', action='store_true', help="Print the parser's warnings to terminal")
     parser.add_argument('-s', '--print_state', action='store_true', help="Print the parser's state values to the terminal")
@@ -20,12 +23,17 @@ def lint_cbn():
     args = parser.parse_args()
 
     config_file = args.config_file
+    corpus = args.corpus
     show_errors = args.errors
     show_warnings = args.warnings
     print_state = args.print_state
     output = args.output
 
-    if config_file:
+    if corpus:
+        if show_warnings or print_state or output:
+            parser.error("argument -c/--corpus: not allowed with -w/--warnings, -s/--print_state or -o/--output")
+        exit(lint_corpus(corpus, show_errors))
+    else:
         parser = Parser()
         try:
             open_file = open(config_file)
@@ -63,9 +71,47 @@ def lint_cbn():
         # if the_state.errors != []:
         #     exit(1)
 
-    else:
-        print("No config file provided... Exiting")
-        exit(0)
+# lints every .conf file under a directory, sharing rule results between identical blocks, returns the exit status
+def lint_corpus(corpus: str, show_errors: bool) -> int:
+    if not os.path.isdir(corpus):
+        print(f"[ERROR] {corpus}, corpus directory does not exist")
+        return 1
+    config_files = sorted(glob.glob(os.path.join(corpus, "**", "*.conf"), recursive=True))
+    if config_files == []:
+        print(f"[ERROR] {corpus}, no .conf files found")
+        return 1
+    table = NodeTable()
+    errors = ""
+    parse_failed = False
+    for config_file in config_files:
+        try:
+            tokens = table.parse_file(config_file)
+        except exceptions.ParseBaseException as oopsie:
+            print(f"[ERROR] {config_file}, {oopsie.explain()}")
+            parse_failed = True
+            continue
+        except (OSError, UnicodeDecodeError) as oopsie:
+            print(f"[ERROR] {config_file}, could not read file: {oopsie}")
+            parse_failed = True
+            continue
+        for digest in table.add_tree(tokens):
+            errors += analyze_node(table, digest, config_file)
+    if show_errors:
+        print(errors, end="")
+    print(table.report())
+    return 1 if parse_failed or errors != "" else 0
+
+# runs the memoized rules on a node and its nested blocks, returning any errors found
+def analyze_node(table: NodeTable, digest: str, config_file: str) -> str:
+    errors = ""
+    results = table.analyze(digest)
+    if results["missing_on_error"]:
+        errors += f"[ERROR] {config_file}, {table.nodes[digest].value.name} is missing an on_error statement\n"
+    for option in results["unsupported_options"]:
+        errors += f"[ERROR] {config_file}, {table.nodes[digest].value.name} does not support the {option} option\n"
+    for child in table.nodes[digest].children:
+        errors += analyze_node(table, child, config_file)
+    return errors
 
 if __name__ == "__main__":
-    lint_cbn()
\ No newline at end of file
+    lint_cbn()
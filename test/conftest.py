@@ -0,0 +1,4 @@
+import os, sys
+
+# the linter's modules import each other by name, so src/ needs to be on the path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
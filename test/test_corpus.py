@@ -0,0 +1,138 @@
+import os, sys
+import pytest
+from Parser import Parser
+from Corpus import NodeTable, RULES
+import lint
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+MULTI_STATEMENT_IF = """
+filter {
+    if [a] != "" {
+        mutate { replace => { "b" => "%%{a}" } on_error => "zerror.replace_b" }
+        grok { match => { "message" => "%%{GREEDYDATA:c}" } %s }
+    }
+}
+"""
+
+def parse(string: str) -> list:
+    return Parser().parse_string(string)
+
+def test_conditional_keeps_every_nested_block():
+    cond = parse(MULTI_STATEMENT_IF % "")[0]
+    assert [type(block).__name__ for block in cond.contents] == ["Mutate", "Grok"]
+
+def test_conditionals_differing_in_a_later_block_are_distinct():
+    table = NodeTable()
+    with_on_error = table.add_tree(parse(MULTI_STATEMENT_IF % 'on_error => "zerror.grok_c"'))
+    without_on_error = table.add_tree(parse(MULTI_STATEMENT_IF % ""))
+    assert with_on_error != without_on_error
+    assert table.seen == 6
+    assert len(table.nodes) == 5
+
+def build_corpus_table(rules: dict = None) -> NodeTable:
+    table = NodeTable(rules)
+    for config_file in sorted(os.listdir(CORPUS_DIR)):
+        for digest in table.add_tree(table.parse_file(os.path.join(CORPUS_DIR, config_file))):
+            lint.analyze_node(table, digest, config_file)
+    return table
+
+def test_corpus_shares_duplicated_blocks():
+    table = build_corpus_table()
+    assert table.files == 2
+    assert table.seen == 13
+    assert len(table.nodes) == 7
+    assert table.dedup_ratio() == 13 / 7
+
+def test_rules_are_computed_once_per_distinct_node():
+    calls = {name: 0 for name in RULES}
+    def counted(name):
+        def rule(node):
+            calls[name] += 1
+            return RULES[name](node)
+        return rule
+    table = build_corpus_table({name: counted(name) for name in RULES})
+    assert calls == {name: len(table.nodes) for name in RULES}
+
+def test_memoized_results_cannot_be_mutated_by_callers():
+    table = build_corpus_table()
+    digest = next(iter(table.nodes))
+    results = table.analyze(digest)
+    results["missing_on_error"] = "changed"
+    assert isinstance(results["unsupported_options"], tuple)
+    assert table.analyze(digest)["missing_on_error"] != "changed"
+
+def test_errors_are_reported_for_every_occurrence(capsys):
+    assert lint.lint_corpus(CORPUS_DIR, True) == 1
+    errors = [line for line in capsys.readouterr().out.splitlines() if line.startswith("[ERROR]")]
+    assert len(errors) == 2
+    assert errors[0].startswith(f"[ERROR] {os.path.join(CORPUS_DIR, 'vendor_a.conf')}, grok")
+    assert errors[1].startswith(f"[ERROR] {os.path.join(CORPUS_DIR, 'vendor_b.conf')}, grok")
+
+def test_missing_corpus_directory_fails():
+    assert lint.lint_corpus(os.path.join(CORPUS_DIR, "missing"), False) == 1
+
+def test_unparseable_files_are_reported_and_the_batch_continues(capsys):
+    invalid_dir = os.path.join(os.path.dirname(CORPUS_DIR), "corpus_invalid")
+    assert lint.lint_corpus(invalid_dir, True) == 1
+    out = capsys.readouterr().out
+    for config_file in ["empty.conf", "not_filter.conf", "not_utf8.conf"]:
+        assert f"[ERROR] {os.path.join(invalid_dir, config_file)}, " in out
+    assert "Expected Keyword 'filter'" in out
+    assert out.splitlines()[-1].startswith("1 configs, 1 blocks, 1 distinct")
+
+def test_clean_corpus_passes(capsys):
+    clean_dir = os.path.join(os.path.dirname(CORPUS_DIR), "corpus_clean")
+    assert lint.lint_corpus(clean_dir, True) == 0
+    out = capsys.readouterr().out
+    assert "[ERROR]" not in out
+    assert out.splitlines()[-1].startswith("2 configs, 12 blocks, 8 distinct")
+
+def test_statements_differing_inside_a_string_are_distinct():
+    table = NodeTable()
+    single_space = table.add_tree(parse('filter { if [a] == "x y" { drop {} } }'))
+    double_space = table.add_tree(parse('filter { if [a] == "x  y" { drop {} } }'))
+    padded = table.add_tree(parse('filter { if   [a] == "x y"   { drop {} } }'))
+    assert single_space != double_space
+    assert single_space == padded
+
+def test_options_missing_from_the_schema_are_unsupported():
+    table = NodeTable()
+    drop, statedump, custom = table.add_tree(parse('filter { drop { tags => "x" } statedump { label => "x" } custom { anything => "x" } }'))
+    assert table.analyze(drop)["unsupported_options"] == ("tags",)
+    assert table.analyze(statedump)["unsupported_options"] == ()
+    assert table.analyze(custom)["unsupported_options"] == ()
+
+def run_cli(monkeypatch, *args) -> int:
+    monkeypatch.setattr(sys, "argv", ["lint.py", *args])
+    with pytest.raises(SystemExit) as exit_info:
+        lint.lint_cbn()
+    return exit_info.value.code
+
+@pytest.mark.parametrize("flag", [["-w"], ["-s"], ["-o", "out.txt"]])
+def test_cli_rejects_single_file_flags_with_corpus(monkeypatch, capsys, flag):
+    assert run_cli(monkeypatch, "-c", CORPUS_DIR, *flag) == 2
+    assert "not allowed with" in capsys.readouterr().err
+
+def test_cli_config_file_and_corpus_are_mutually_exclusive(monkeypatch, capsys):
+    assert run_cli(monkeypatch, "-f", os.path.join(CORPUS_DIR, "vendor_a.conf"), "-c", CORPUS_DIR) == 2
+    assert "not allowed with" in capsys.readouterr().err
+
+def test_cli_requires_config_file_or_corpus(monkeypatch, capsys):
+    assert run_cli(monkeypatch) == 2
+    assert "one of the arguments -f/--config_file -c/--corpus is required" in capsys.readouterr().err
+
+def test_cli_fails_on_directory_without_configs(monkeypatch, capsys, tmp_path):
+    (tmp_path / "notes.txt").write_text("not a config")
+    assert run_cli(monkeypatch, "-c", str(tmp_path)) == 1
+    assert "no .conf files found" in capsys.readouterr().out
+
+def test_cli_clean_corpus_exits_zero(monkeypatch, capsys):
+    assert run_cli(monkeypatch, "-c", os.path.join(os.path.dirname(CORPUS_DIR), "corpus_clean"), "-e") == 0
+    assert capsys.readouterr().out.startswith("2 configs, ")
+
+def test_cli_parse_failures_still_print_the_report(monkeypatch, capsys):
+    assert run_cli(monkeypatch, "-c", os.path.join(os.path.dirname(CORPUS_DIR), "corpus_invalid")) == 1
+    out = capsys.readouterr().out
+    assert out.count("[ERROR]") == 3
+    assert out.splitlines()[-1].startswith("1 configs, 1 blocks, 1 distinct")